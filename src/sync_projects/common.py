@@ -1,14 +1,31 @@
 import os
+import json
+import hashlib
 import requests
+from urllib.parse import urlparse, parse_qs
 
-def graphql(query, variables=None, api_url=None, token=None):
-    """Execute a GraphQL query against the GitHub API"""
-    if api_url is None:
-        api_url = os.environ.get("GITHUB_API", "https://api.github.com/graphql")
+REST_API = os.environ.get("GITHUB_REST_API", "https://api.github.com")
+
+# Directory of the conditional request cache, disabled when not set
+HTTP_CACHE_DIR = os.environ.get("HTTP_CACHE_DIR")
+
+_session = requests.Session()
+
+
+def get_token(token=None):
+    """Get the GitHub token from the environment when not given"""
     if token is None:
         token = os.environ.get("GITHUB_TOKEN") or os.environ.get("PROJECTS_TOKEN")
         if not token:
             raise RuntimeError("GITHUB_TOKEN or PROJECTS_TOKEN is not set")
+    return token
+
+
+def graphql(query, variables=None, api_url=None, token=None):
+    """Execute a GraphQL query against the GitHub API"""
+    if api_url is None:
+        api_url = os.environ.get("GITHUB_API", "https://api.github.com/graphql")
+    token = get_token(token)
     headers = {
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json",
@@ -20,3 +37,103 @@ def graphql(query, variables=None, api_url=None, token=None):
     )
     response.raise_for_status()
     return response.json().get("data", {})
+
+
+def _cache_path(cache_dir, url):
+    return os.path.join(cache_dir, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json")
+
+
+def _read_cache(cache_dir, url):
+    try:
+        with open(_cache_path(cache_dir, url), encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return entry if entry.get("url") == url else None
+
+
+def write_json(path, data):
+    """Write a JSON file atomically, so that an interrupted run never leaves a partial file"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(path + ".tmp", path)
+
+
+def _write_cache(cache_dir, url, entry):
+    write_json(_cache_path(cache_dir, url), entry)
+
+
+def _may_have_next_page(url, body):
+    """Whether a page cached as the last one is full, so that a new page may follow it"""
+    per_page = int(parse_qs(urlparse(url).query).get("per_page", ["30"])[0])
+    return isinstance(body, list) and len(body) >= per_page
+
+
+def rest_request(url, method="GET", payload=None, token=None, cache_dir=None):
+    """Send a request to the GitHub REST API, returns the JSON body and the next page URL
+
+    GET requests are made conditional on the ETag / Last-Modified of the
+    cached response, if any, and the cached body is returned when GitHub
+    answers 304 Not Modified, which does not count against the rate limit.
+    As the ETag does not cover the link to the next page, a full page cached
+    as the last one is requested again without conditions.
+    """
+    if not url.startswith("http"):
+        url = REST_API + url
+    if cache_dir is None:
+        cache_dir = HTTP_CACHE_DIR
+    headers = {
+        "Authorization": f"Bearer {get_token(token)}",
+        "Accept": "application/vnd.github+json",
+    }
+
+    entry = None
+    if method == "GET" and cache_dir:
+        entry = _read_cache(cache_dir, url)
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("lastModified"):
+                headers["If-Modified-Since"] = entry["lastModified"]
+
+    response = _session.request(method, url, headers=headers, json=payload)
+    if response.status_code == 304 and entry:
+        # The ETag only covers the body, not the Link header to the next page
+        if response.headers.get("Link"):
+            return entry["body"], response.links.get("next", {}).get("url")
+        if entry.get("next") or not _may_have_next_page(url, entry["body"]):
+            return entry["body"], entry.get("next")
+        headers.pop("If-None-Match", None)
+        headers.pop("If-Modified-Since", None)
+        response = _session.request(method, url, headers=headers, json=payload)
+    response.raise_for_status()
+
+    body = response.json() if response.content else None
+    next_url = response.links.get("next", {}).get("url")
+    if method == "GET" and cache_dir and (
+        response.headers.get("ETag") or response.headers.get("Last-Modified")
+    ):
+        _write_cache(cache_dir, url, {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "lastModified": response.headers.get("Last-Modified"),
+            "next": next_url,
+            "body": body,
+        })
+    return body, next_url
+
+
+def rest(path, method="GET", payload=None, token=None, cache_dir=None):
+    """Send a request to the GitHub REST API, returns the JSON body"""
+    return rest_request(path, method, payload, token, cache_dir)[0]
+
+
+def rest_list(path, token=None, cache_dir=None):
+    """Get all the elements of a paginated GitHub REST API list"""
+    elements = []
+    url = path + ("&" if "?" in path else "?") + "per_page=100"
+    while url:
+        page, url = rest_request(url, token=token, cache_dir=cache_dir)
+        elements.extend(page)
+    return elements
@@ -0,0 +1,178 @@
+import os
+import sys
+import logging
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+logger = logging.getLogger("config")
+
+DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(__file__), "sync_config.toml")
+
+# Value transforms which can be applied to a source value before it is synced
+TRANSFORMS = {
+    "strip": lambda value: str(value).strip(),
+    "lower": lambda value: str(value).lower(),
+    "upper": lambda value: str(value).upper(),
+    "round": lambda value: float(round(value)),
+}
+
+# Target field data types each transform applies to
+STRING_TYPES = ("TEXT", "SINGLE_SELECT", "ITERATION")
+TRANSFORM_TYPES = {
+    "strip": STRING_TYPES,
+    "lower": STRING_TYPES,
+    "upper": STRING_TYPES,
+    "round": ("NUMBER",),
+}
+
+# Mutation used to update a field, by field data type, with the name and the
+# conversion of the variable holding the value
+MUTATION_TEMPLATE = """
+mutation($projectId: ID!, $itemId: ID!, $fieldId: ID!, ${variable}: {graphql_type}!) {{
+  updateProjectV2ItemFieldValue(input: {{
+    projectId: $projectId
+    itemId: $itemId
+    fieldId: $fieldId
+    value: {{ {value_key}: ${variable} }}
+  }}) {{
+    projectV2Item {{
+      id
+    }}
+  }}
+}}
+"""
+
+MUTATIONS = {
+    data_type: (
+        MUTATION_TEMPLATE.format(variable=variable, graphql_type=graphql_type, value_key=value_key),
+        variable,
+        convert,
+    )
+    for data_type, variable, graphql_type, value_key, convert in (
+        ("SINGLE_SELECT", "optionId", "String", "singleSelectOptionId", str),
+        ("NUMBER", "number", "Float", "number", float),
+        ("ITERATION", "iterationId", "String", "iterationId", str),
+        ("TEXT", "text", "String", "text", str),
+        ("DATE", "date", "Date", "date", str),
+    )
+}
+
+
+class FieldMapping:
+    """A source to target field mapping resolved against the target project fields
+
+    Option and iteration names are resolved once into lookup tables, so that
+    mapping a value only costs dictionary lookups.
+    """
+
+    def __init__(self, source_name, target_field, transform=None, aliases=None):
+        self.source_name = source_name
+        self.target_name = target_field["name"]
+        self.field_id = target_field["id"]
+        self.data_type = target_field.get("dataType", "").upper()
+        self.mutation, self.variable, self.convert = MUTATIONS[self.data_type]
+        self.transform = TRANSFORMS[transform] if transform else None
+
+        # Lower cased source name -> (target name, target ID)
+        self.choices = None
+        if self.data_type == "SINGLE_SELECT":
+            choices = target_field.get("options") or []
+        elif self.data_type == "ITERATION":
+            configuration = target_field.get("configuration") or {}
+            choices = [
+                {"id": it["id"], "name": it["title"]}
+                for it in configuration.get("iterations", []) + configuration.get("completedIterations", [])
+            ]
+        else:
+            choices = None
+        if choices is not None:
+            self.choices = {c["name"].lower(): (c["name"], c["id"]) for c in choices}
+            for alias, name in (aliases or {}).items():
+                if name.lower() in self.choices:
+                    self.choices[alias.lower()] = self.choices[name.lower()]
+                else:
+                    logger.warning(f"Alias target '{name}' not found in field '{self.target_name}'")
+
+    def resolve(self, value):
+        """Map a source value to (target value as displayed, value to send), None if unmapped
+
+        Raises ValueError or TypeError when the value does not fit the transform
+        or the target field type.
+        """
+        if self.transform:
+            value = self.transform(value)
+        if self.choices is None:
+            return value, self.convert(value)
+        return self.choices.get(str(value).lower())
+
+
+def _check_field_mappings(mappings, path):
+    """Check configured field mappings, raises ValueError on the first invalid one"""
+    if not isinstance(mappings, list):
+        raise ValueError(f"Field mappings must be a list in {path}")
+    for mapping in mappings:
+        if not isinstance(mapping, dict):
+            raise ValueError(f"Field mapping must be a table in {path}: {mapping!r}")
+        for key in ("source", "target"):
+            if not isinstance(mapping.get(key), str):
+                raise ValueError(f"Field mapping without '{key}' field name in {path}: {mapping}")
+        if mapping.get("transform") and mapping["transform"] not in TRANSFORMS:
+            raise ValueError(f"Unknown transform '{mapping['transform']}' in {path}")
+        if not isinstance(mapping.get("aliases", {}), dict):
+            raise ValueError(f"Aliases of field '{mapping['source']}' must be a table in {path}")
+
+
+def load_config(path=None):
+    """Load the synchronization configuration, SYNC_CONFIG overrides the default path"""
+    path = path or os.environ.get("SYNC_CONFIG", DEFAULT_CONFIG_PATH)
+    with open(path, "rb") as f:
+        config = tomllib.load(f)
+    _check_field_mappings(config.get("fields", []), path)
+    for pair in config.get("sync", []):
+        for key in ("source", "target"):
+            if not isinstance(pair.get(key), int):
+                raise ValueError(f"Sync pair without '{key}' project number in {path}: {pair}")
+        if "fields" in pair:
+            _check_field_mappings(pair["fields"], path)
+    return config
+
+
+def pair_field_mappings(config, pair):
+    """Get the field mappings of a sync pair, falling back on the default mappings"""
+    return pair.get("fields", config.get("fields", []))
+
+
+def compile_field_mappings(mappings, source_fields, target_fields):
+    """Compile the configured field mappings against the fields of both projects"""
+    source_names = {field.get("name", "").lower() for field in source_fields}
+    target_by_name = {}
+    for field in target_fields:
+        target_by_name.setdefault(field.get("name", "").lower(), field)
+
+    compiled = []
+    for mapping in mappings:
+        if mapping["source"].lower() not in source_names:
+            logger.warning(f"Field '{mapping['source']}' not found in source project, skipping")
+            continue
+
+        target_field = target_by_name.get(mapping["target"].lower())
+        if not target_field:
+            logger.warning(f"Field '{mapping['target']}' not found in target project, skipping")
+            continue
+
+        data_type = target_field.get("dataType", "").upper()
+        if data_type not in MUTATIONS:
+            logger.error(f"Unsupported field type: {data_type}")
+            continue
+
+        transform = mapping.get("transform")
+        if transform and data_type not in TRANSFORM_TYPES[transform]:
+            logger.error(f"Transform '{transform}' does not apply to {data_type} field '{target_field['name']}', skipping")
+            continue
+
+        field_mapping = FieldMapping(mapping["source"], target_field, transform, mapping.get("aliases"))
+        compiled.append(field_mapping)
+    return compiled
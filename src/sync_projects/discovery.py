@@ -0,0 +1,164 @@
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+from fnmatch import fnmatch
+from urllib.parse import quote
+from .common import graphql, rest_list, write_json, HTTP_CACHE_DIR
+
+logger = logging.getLogger("discovery")
+
+# Seconds during which the persisted project index is reused without listing projects
+PROJECT_INDEX_MAX_AGE = int(os.environ.get("PROJECT_INDEX_MAX_AGE", "3600"))
+
+# Project indexes already loaded in this run, by organization
+_project_indexes = {}
+
+# Organizations whose projects were already listed in this run
+_listed_orgs = set()
+
+
+def list_repositories(org, archived=None, topic=None, pattern=None):
+    """List the repositories of an organization, following every page
+
+    The repositories can be filtered on their archived state, on a topic and
+    on a shell style pattern of their name.
+    """
+    repos = rest_list(f"/orgs/{quote(org)}/repos?type=all")
+    logger.info(f"Found {len(repos)} repositories in {org}")
+    return [
+        repo for repo in repos
+        if (archived is None or bool(repo.get("archived")) == archived)
+        and (topic is None or topic in repo.get("topics", []))
+        and (pattern is None or fnmatch(repo["name"], pattern))
+    ]
+
+
+def list_projects(org):
+    """List all the ProjectsV2 of an organization, following the cursor"""
+    query = """
+    query($owner: String!, $after: String) {
+      organization(login: $owner) {
+        projectsV2(first: 100, after: $after) {
+          pageInfo {
+            hasNextPage
+            endCursor
+          }
+          nodes {
+            id
+            number
+            title
+            closed
+          }
+        }
+      }
+    }
+    """
+
+    projects = []
+    after = None
+    while True:
+        result = graphql(query, {"owner": org, "after": after})
+        page = result["organization"]["projectsV2"]
+        projects.extend(page["nodes"])
+        if not page["pageInfo"]["hasNextPage"]:
+            break
+        after = page["pageInfo"]["endCursor"]
+    logger.info(f"Found {len(projects)} projects in {org}")
+    return projects
+
+
+def _project_index_path(org):
+    return os.path.join(HTTP_CACHE_DIR, f"projects-{org}.json") if HTTP_CACHE_DIR else None
+
+
+def _read_project_index(path):
+    """Read a persisted project index, None if it is missing, invalid or too old"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+        if time.time() - cached["fetchedAt"] < PROJECT_INDEX_MAX_AGE:
+            return dict(cached["projects"])
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring the project index {path}: {e}")
+    return None
+
+
+def get_project_index(org, refresh=False):
+    """Get the title -> {number, id, closed} index of the projects of an organization
+
+    The index is kept for the run, and persisted in HTTP_CACHE_DIR for
+    PROJECT_INDEX_MAX_AGE seconds, so that the projects are not listed again
+    for every lookup.
+    """
+    if not refresh and org in _project_indexes:
+        return _project_indexes[org]
+
+    path = _project_index_path(org)
+    if not refresh and path and os.path.exists(path):
+        index = _read_project_index(path)
+        if index is not None:
+            _project_indexes[org] = index
+            return index
+
+    index = {}
+    for project in list_projects(org):
+        index.setdefault(
+            project["title"],
+            {"number": project["number"], "id": project["id"], "closed": project["closed"]},
+        )
+    _project_indexes[org] = index
+    _listed_orgs.add(org)
+    if path:
+        write_json(path, {"fetchedAt": time.time(), "projects": index})
+    return index
+
+
+def find_project(org, title):
+    """Find a project by title
+
+    When the index misses the title, the projects are listed again, unless
+    they were already listed in this run.
+    """
+    project = get_project_index(org).get(title)
+    if project is None and org not in _listed_orgs:
+        project = get_project_index(org, refresh=True).get(title)
+    return project
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="List the repositories or projects of an organization")
+    parser.add_argument("org")
+    parser.add_argument("--projects", action="store_true",
+                        help="List the projects as TITLE<tab>NUMBER<tab>ID instead of the repositories")
+    parser.add_argument("--find", metavar="TITLE",
+                        help="Print the NUMBER<tab>ID of the project with this title")
+    parser.add_argument("--include-archived", action="store_true")
+    parser.add_argument("--topic", help="Only repositories with this topic")
+    parser.add_argument("--pattern", help="Only repositories whose name matches this pattern")
+    args = parser.parse_args(argv)
+
+    if args.find:
+        project = find_project(args.org, args.find)
+        if project is None:
+            logger.error(f"Could not find project '{args.find}' in {args.org}")
+            return 1
+        print(f"{project['number']}\t{project['id']}")
+        return 0
+
+    if args.projects:
+        for title, project in get_project_index(args.org).items():
+            print(f"{title}\t{project['number']}\t{project['id']}")
+        return 0
+
+    archived = None if args.include_archived else False
+    for repo in list_repositories(args.org, archived, args.topic, args.pattern):
+        print(repo["full_name"])
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+    sys.exit(main())
@@ -0,0 +1,194 @@
+import logging
+from .common import graphql
+
+logger = logging.getLogger("projects")
+
+
+def get_project_id(project_number, org):
+    """Get the ID of a GitHub Project of an organization based on its number"""
+
+    query = f"""
+    query($owner: String!, $number: Int!) {{
+      organization(login: $owner) {{
+        projectV2(number: $number) {{
+          id
+        }}
+      }}
+    }}
+    """
+
+    try:
+        result = graphql(query, {"owner": org, "number": project_number})
+        logger.debug(result)
+        if not result or not result.get("organization", {}).get("projectV2", {}).get("id"):
+            logger.error(f"Could not find project {project_number} for organization {org}")
+            return None
+
+        project_id = result["organization"]["projectV2"]["id"]
+        logger.info(f"Found project ID: {project_id}")
+        return project_id
+    except Exception as e:
+        logger.error(f"Error fetching project ID: {e}")
+        raise
+
+
+def get_project_fields(project_id):
+    """Get all field definitions for a project"""
+    logger.info(f"Getting fields for project {project_id}")
+
+    query = """
+    query($projectId: ID!) {
+      node(id: $projectId) {
+        ... on ProjectV2 {
+          fields(first: 50) {
+            nodes {
+              ... on ProjectV2Field {
+                id
+                name
+                dataType
+              }
+              ... on ProjectV2IterationField {
+                id
+                name
+                dataType
+                configuration {
+                  iterations {
+                    id
+                    title
+                    startDate
+                    duration
+                  }
+                  completedIterations {
+                    id
+                    title
+                    startDate
+                    duration
+                  }
+                }
+              }
+              ... on ProjectV2SingleSelectField {
+                id
+                name
+                dataType
+                options {
+                  id
+                  name
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+    """
+
+    try:
+        result = graphql(query, {"projectId": project_id})
+        fields = result["node"]["fields"]["nodes"]
+        logger.info(f"Found {len(fields)} fields")
+        return fields
+    except Exception as e:
+        logger.error(f"Error fetching project fields: {e}")
+        raise
+
+
+def get_project_items(project_id):
+    """Get all items in the project with their field values"""
+    logger.info(f"Getting items for project {project_id}")
+
+    query = """
+    query($projectId: ID!, $after: String) {
+      node(id: $projectId) {
+        ... on ProjectV2 {
+          items(first: 100, after: $after) {
+            pageInfo {
+              hasNextPage
+              endCursor
+            }
+            nodes {
+              id
+              fieldValues(first: 50) {
+                nodes {
+                  ... on ProjectV2ItemFieldTextValue {
+                    text
+                    field {
+                      ... on ProjectV2FieldCommon {
+                        name
+                        id
+                      }
+                    }
+                  }
+                  ... on ProjectV2ItemFieldDateValue {
+                    date
+                    field {
+                      ... on ProjectV2FieldCommon {
+                        name
+                        id
+                      }
+                    }
+                  }
+                  ... on ProjectV2ItemFieldNumberValue {
+                    number
+                    field {
+                      ... on ProjectV2FieldCommon {
+                        name
+                        id
+                      }
+                    }
+                  }
+                  ... on ProjectV2ItemFieldSingleSelectValue {
+                    name
+                    field {
+                      ... on ProjectV2FieldCommon {
+                        name
+                        id
+                      }
+                    }
+                  }
+                  ... on ProjectV2ItemFieldIterationValue {
+                    title
+                    field {
+                      ... on ProjectV2FieldCommon {
+                        name
+                        id
+                      }
+                    }
+                  }
+                }
+              }
+              content {
+                __typename
+                ... on Issue {
+                  id
+                  number
+                  title
+                  repository {
+                    name
+                    owner {
+                      login
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+    """
+
+    try:
+        items = []
+        after = None
+        while True:
+            result = graphql(query, {"projectId": project_id, "after": after})
+            page = result["node"]["items"]
+            items.extend(page["nodes"])
+            if not page["pageInfo"]["hasNextPage"]:
+                break
+            after = page["pageInfo"]["endCursor"]
+        logger.info(f"Found {len(items)} items")
+        return items
+    except Exception as e:
+        logger.error(f"Error fetching project items: {e}")
+        raise
@@ -3,9 +3,11 @@ import sys
 import json
 import requests
 from .common import graphql
+from .config import load_config
 
-PROJECT_ID = os.environ.get("PROJECT_ID", "PVT_kwDOAVayxs4BKQLN")
-FIELD_ID = os.environ.get("FIELD_ID", "PVTF_lADOAVayxs4BKQLNzg8wxNg")
+ESDIS_REF_CONFIG = load_config().get("esdis_ref", {})
+PROJECT_ID = os.environ.get("PROJECT_ID", ESDIS_REF_CONFIG.get("project_id"))
+FIELD_ID = os.environ.get("FIELD_ID", ESDIS_REF_CONFIG.get("field_id"))
 
 
 def get_issue(issue_node_id):
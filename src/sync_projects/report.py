@@ -0,0 +1,235 @@
+import gc
+import os
+import sys
+import csv
+import json
+import zlib
+import logging
+import argparse
+from collections import Counter, defaultdict
+from .snapshot import read_snapshot, export_project_snapshot, pack_item
+from .config import load_config
+from .projects import get_project_id, get_project_fields, get_project_items
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stderr)]
+)
+logger = logging.getLogger("report")
+
+CONFIG = load_config()
+ORG = CONFIG.get("org", "podaac")
+# The TVA board is the target of the configured synchronizations
+TVA_PROJECT_NUMBER = CONFIG["sync"][0]["target"] if CONFIG.get("sync") else 74
+ESDIS_REF_FIELD_ID = CONFIG.get("esdis_ref", {})["field_id"]
+
+STATUS_FIELD = "Status"
+ESTIMATE_FIELD = "Estimate"
+# The source boards name their iteration field "Sprint"
+ITERATION_FIELDS = ("Iteration", "Sprint")
+DONE_STATUS = "Done"
+NO_VALUE = "(none)"
+
+BURNDOWN_COLUMNS = ["esdisRef", "iteration", "startDate", "items", "estimate",
+                    "doneEstimate", "remainingEstimate"]
+STATUS_COLUMNS = ["status", "items", "estimate"]
+
+
+def load_board(project_number, snapshot=None, refresh=False):
+    """Load the fields and items of a board, from its snapshot when it is cached
+
+    The items are packed as in the snapshots. The board is fetched from GitHub when there is no readable snapshot, or
+    when refresh is requested, and the snapshot is (re)written if a path is
+    given.
+    """
+    if snapshot and os.path.exists(snapshot) and not refresh:
+        try:
+            _, fields, items = read_snapshot(snapshot, packed=True)
+            return fields, items
+        except (OSError, EOFError, ValueError, zlib.error) as e:
+            logger.warning(f"Fetching project {project_number} again, cannot read snapshot {snapshot}: {e}")
+
+    if snapshot:
+        exported = export_project_snapshot(project_number, ORG, snapshot)
+        if not exported:
+            raise RuntimeError(f"Could not find project {project_number}")
+        _, fields, items = exported
+        return fields, [pack_item(item) for item in items]
+
+    project_id = get_project_id(project_number, ORG)
+    if not project_id:
+        raise RuntimeError(f"Could not find project {project_number}")
+    items = get_project_items(project_id)
+    return get_project_fields(project_id), [pack_item(item) for item in items]
+
+
+def iteration_start_dates(fields):
+    """Map iteration titles to their start date from the iteration field definitions"""
+    start_dates = {}
+    for field in fields:
+        if field.get("name") not in ITERATION_FIELDS:
+            continue
+        configuration = field.get("configuration") or {}
+        for iteration in (configuration.get("iterations", []) +
+                          configuration.get("completedIterations", [])):
+            start_dates.setdefault(iteration["title"], iteration["startDate"])
+    return start_dates
+
+
+def item_row(item, ref_field):
+    """Extract (status, estimate, iteration, ESDIS ref) from a packed project item"""
+    status = estimate = iteration = ref = None
+    for name, field_id, _, value in item["values"]:
+        if name == STATUS_FIELD:
+            status = value
+        elif name == ESTIMATE_FIELD:
+            estimate = value
+        elif name in ITERATION_FIELDS:
+            iteration = value
+        elif ref_field in (name, field_id):
+            ref = value
+    return status or NO_VALUE, estimate or 0, iteration or NO_VALUE, ref or NO_VALUE
+
+
+def merge_boards(boards):
+    """Concatenate the items of several boards, keeping the first item of each issue"""
+    seen = set()
+    items = []
+    for _, board_items in boards:
+        for item in board_items:
+            content = item.get("content") or {}
+            if content.get("__typename") == "Issue":
+                key = (content["repository"]["owner"]["login"],
+                       content["repository"]["name"], content["number"])
+            else:
+                key = item["id"]
+            if key in seen:
+                continue
+            seen.add(key)
+            items.append(item)
+    return items
+
+
+def build_report(boards, ref_field=ESDIS_REF_FIELD_ID):
+    """Aggregate the packed items of the boards into the ESDIS report
+
+    The first board takes precedence for issues present on several boards.
+    Returns the estimate total, the item count and estimate per status, and
+    the burn-down of each ESDIS reference per iteration, in iteration order.
+    """
+    start_dates = {}
+    for fields, _ in boards:
+        for title, start_date in iteration_start_dates(fields).items():
+            start_dates.setdefault(title, start_date)
+
+    status_counts = Counter()
+    status_estimates = defaultdict(float)
+    # (ESDIS ref, iteration) -> [items, estimate, done estimate]
+    cells = defaultdict(lambda: [0, 0.0, 0.0])
+    ref_estimates = defaultdict(float)
+
+    rows = [item_row(item, ref_field) for item in merge_boards(boards)]
+    for status, estimate, iteration, ref in rows:
+        status_counts[status] += 1
+        status_estimates[status] += estimate
+        ref_estimates[ref] += estimate
+        cell = cells[(ref, iteration)]
+        cell[0] += 1
+        cell[1] += estimate
+        if status == DONE_STATUS:
+            cell[2] += estimate
+
+    def iteration_order(iteration):
+        # Unscheduled items come last, unknown iterations just before them
+        return (iteration == NO_VALUE, start_dates.get(iteration) or "9999", iteration)
+
+    burndown = []
+    remaining = dict(ref_estimates)
+    for ref, iteration in sorted(cells, key=lambda k: (k[0], iteration_order(k[1]))):
+        items, estimate, done = cells[(ref, iteration)]
+        remaining[ref] -= done
+        burndown.append({
+            "esdisRef": ref,
+            "iteration": iteration,
+            "startDate": start_dates.get(iteration),
+            "items": items,
+            "estimate": estimate,
+            "doneEstimate": done,
+            "remainingEstimate": remaining[ref],
+        })
+
+    return {
+        "items": len(rows),
+        "estimateTotal": sum(ref_estimates.values()),
+        "status": [
+            {"status": status, "items": count, "estimate": status_estimates[status]}
+            for status, count in status_counts.most_common()
+        ],
+        "burndown": burndown,
+    }
+
+
+def write_report(report, output, output_format="json", table="burndown"):
+    """Write the report as JSON, or one of its tables as CSV"""
+    if output_format == "json":
+        json.dump(report, output, indent=2)
+        output.write("\n")
+        return
+    columns = BURNDOWN_COLUMNS if table == "burndown" else STATUS_COLUMNS
+    writer = csv.DictWriter(output, fieldnames=columns)
+    writer.writeheader()
+    writer.writerows(report[table])
+
+
+def source_project_numbers(project_number):
+    """Get the numbers of the boards synchronized into a project"""
+    return [pair["source"] for pair in CONFIG.get("sync", []) if pair["target"] == project_number]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compute the ESDIS report from the TVA board")
+    parser.add_argument("--project", type=int, default=TVA_PROJECT_NUMBER,
+                        help="TVA project number")
+    parser.add_argument("--include-sources", action="store_true",
+                        help="Also include the boards synchronized into the project")
+    parser.add_argument("--snapshot-dir",
+                        help="Directory where board snapshots are cached")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Fetch the boards even when their snapshot is cached")
+    parser.add_argument("--ref-field", default=ESDIS_REF_FIELD_ID,
+                        help="Name or ID of the ESDIS reference field")
+    parser.add_argument("--format", choices=("json", "csv"), default="json")
+    parser.add_argument("--table", choices=("burndown", "status"), default="burndown",
+                        help="Table written in CSV format")
+    parser.add_argument("--output", help="Output file, standard output by default")
+    args = parser.parse_args(argv)
+
+    project_numbers = [args.project]
+    if args.include_sources:
+        project_numbers.extend(source_project_numbers(args.project))
+
+    if args.snapshot_dir:
+        os.makedirs(args.snapshot_dir, exist_ok=True)
+
+    boards = []
+    for number in project_numbers:
+        snapshot = None
+        if args.snapshot_dir:
+            snapshot = os.path.join(args.snapshot_dir, f"project-{number}.jsonl.gz")
+        boards.append(load_board(number, snapshot, args.refresh))
+    # The boards are kept until the end, spare the collector from scanning them again
+    gc.freeze()
+
+    report = build_report(boards, args.ref_field)
+    if args.output:
+        with open(args.output, "w", newline="") as f:
+            write_report(report, f, args.format, args.table)
+    else:
+        write_report(report, sys.stdout, args.format, args.table)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+import os
+import sys
+import gzip
+import json
+import logging
+from .projects import get_project_id, get_project_fields, get_project_items
+
+logger = logging.getLogger("snapshot")
+
+SNAPSHOT_SCHEMA = "podaac_meta.project_snapshot"
+SNAPSHOT_VERSION = 1
+
+# Keys holding the value of a ProjectV2 item field value node, by GraphQL type
+VALUE_KEYS = ("text", "number", "date", "name", "title")
+
+
+def _open(path, mode, compressed):
+    """Open a snapshot file, gzip compressed or not"""
+    if compressed:
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def pack_item(item):
+    """Flatten the field values of a project item into [name, id, key, value] rows"""
+    values = []
+    for node in item.get("fieldValues", {}).get("nodes", []):
+        field = node.get("field") or {}
+        for key in VALUE_KEYS:
+            if key in node:
+                values.append([field.get("name"), field.get("id"), key, node[key]])
+                break
+    return {"id": item["id"], "content": item.get("content"), "values": values}
+
+
+def _unpack_item(row):
+    """Rebuild a project item with the same shape as the GraphQL response"""
+    nodes = [
+        {key: value, "field": {"name": name, "id": field_id}}
+        for name, field_id, key, value in row["values"]
+    ]
+    return {"id": row["id"], "content": row["content"], "fieldValues": {"nodes": nodes}}
+
+
+def write_snapshot(path, project, fields, items):
+    """Write a project, its fields and its items to a JSONL snapshot
+
+    The first line is a schema header with the project and its field
+    definitions, every following line is one item. Paths ending in .gz are
+    gzip compressed. The file is written then renamed, so that an
+    interrupted run never leaves a partial snapshot.
+    """
+    header = {
+        "schema": SNAPSHOT_SCHEMA,
+        "version": SNAPSHOT_VERSION,
+        "project": project,
+        "fields": fields,
+        "itemCount": len(items),
+    }
+    with _open(path + ".tmp", "w", path.endswith(".gz")) as f:
+        f.write(json.dumps(header, separators=(",", ":")) + "\n")
+        for item in items:
+            f.write(json.dumps(pack_item(item), separators=(",", ":")) + "\n")
+    os.replace(path + ".tmp", path)
+    logger.info(f"Wrote {len(items)} items to snapshot {path}")
+
+
+def read_snapshot(path, packed=False):
+    """Read a JSONL snapshot, returns the project, its fields and its items
+
+    The items have the shape of the GraphQL response, or are left as written
+    by pack_item if packed is set. Raises ValueError if the file is not a
+    complete snapshot.
+    """
+    with _open(path, "r", path.endswith(".gz")) as f:
+        header = json.loads(f.readline())
+        if header.get("schema") != SNAPSHOT_SCHEMA:
+            raise ValueError(f"{path} is not a project snapshot")
+        if header.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot version {header.get('version')} in {path}"
+            )
+        items = [json.loads(line) for line in f if line.strip()]
+    if len(items) != header.get("itemCount"):
+        raise ValueError(f"Truncated snapshot {path}: {len(items)} of {header.get('itemCount')} items")
+    if not packed:
+        items = [_unpack_item(row) for row in items]
+    logger.info(f"Read {len(items)} items from snapshot {path}")
+    return header["project"], header["fields"], items
+
+
+def export_project_snapshot(project_number, org, path):
+    """Fetch a project of an organization from GitHub and write it to a snapshot
+
+    Returns the project, its fields and its items, or None if the project
+    can not be found.
+    """
+    project_id = get_project_id(project_number, org)
+    if not project_id:
+        return None
+    project = {"number": project_number, "id": project_id}
+    fields = get_project_fields(project_id)
+    items = get_project_items(project_id)
+    write_snapshot(path, project, fields, items)
+    return project, fields, items
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 4:
+        print(f"Usage: {os.path.basename(sys.argv[0])} ORG PROJECT_NUMBER PATH", file=sys.stderr)
+        sys.exit(2)
+    logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+    sys.exit(0 if export_project_snapshot(int(sys.argv[2]), sys.argv[1], sys.argv[3]) else 1)
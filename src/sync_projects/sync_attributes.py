@@ -1,7 +1,11 @@
 import os
 import sys
 import logging
+import argparse
 from .common import graphql
+from .projects import get_project_id, get_project_fields, get_project_items
+from .snapshot import read_snapshot
+from .config import load_config, pair_field_mappings, compile_field_mappings
 import requests
 
 # Configure logging
@@ -12,184 +16,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger("sync_attributes")
 
-# Get authentication token
-token = os.environ.get("GITHUB_TOKEN")
-if not token:
-    raise RuntimeError("GITHUB_TOKEN is not set")
-
-# Get configuration from environment variables
-ORG = "podaac"
+# Get configuration from the sync configuration file and environment variables
+CONFIG = load_config()
+ORG = CONFIG.get("org", "podaac")
 REPO_NAME = os.environ.get("GITHUB_REPOSITORY", "").split("/")[1] if "/" in os.environ.get("GITHUB_REPOSITORY", "") else ""
 REPO_OWNER = os.environ.get("GITHUB_REPOSITORY", "").split("/")[0] if "/" in os.environ.get("GITHUB_REPOSITORY", "") else ""
 
-# Fields to synchronize
-FIELDS_TO_SYNC = {"Status": "Status", "Estimate": "Estimate", "Sprint":"Iteration"}
-
-
+# Fields to synchronize, unless a sync pair defines its own
+FIELDS_TO_SYNC = CONFIG.get("fields", [])
 
-def get_project_id(project_number, org=None):
-    """Get the ID of a GitHub Project based on its number"""
 
-    query = f"""
-    query($owner: String!, $number: Int!) {{
-      organization(login: $owner) {{
-        projectV2(number: $number) {{
-          id
-        }}
-      }}
-    }}
-    """
-
-    try:
-        result = graphql(query, {"owner": ORG, "number": project_number})
-        logger.debug(result)
-        if not result or not result.get("organization", {}).get("projectV2", {}).get("id"):
-            logger.error(f"Could not find project {project_number} for organization {ORG}")
-            return None
-
-        project_id = result["organization"]["projectV2"]["id"]
-        logger.info(f"Found project ID: {project_id}")
-        return project_id
-    except Exception as e:
-        logger.error(f"Error fetching project ID: {e}")
-        raise
-
-
-def get_project_fields(project_id):
-    """Get all field definitions for a project"""
-    logger.info(f"Getting fields for project {project_id}")
-
-    query = """
-    query($projectId: ID!) {
-      node(id: $projectId) {
-        ... on ProjectV2 {
-          fields(first: 50) {
-            nodes {
-              ... on ProjectV2Field {
-                id
-                name
-                dataType
-              }
-              ... on ProjectV2IterationField {
-                id
-                name
-                dataType
-              }
-              ... on ProjectV2SingleSelectField {
-                id
-                name
-                dataType
-                options {
-                  id
-                  name
-                }
-              }
-            }
-          }
-        }
-      }
-    }
-    """
-
-    try:
-        result = graphql(query, {"projectId": project_id})
-        fields = result["node"]["fields"]["nodes"]
-        logger.info(f"Found {len(fields)} fields")
-        return fields
-    except Exception as e:
-        logger.error(f"Error fetching project fields: {e}")
-        raise
-
-
-def get_project_items(project_id):
-    """Get all items in the project with their field values"""
-    logger.info(f"Getting items for project {project_id}")
-
-    query = """
-    query($projectId: ID!) {
-      node(id: $projectId) {
-        ... on ProjectV2 {
-          items(first: 100) {
-            nodes {
-              id
-              fieldValues(first: 50) {
-                nodes {
-                  ... on ProjectV2ItemFieldTextValue {
-                    text
-                    field {
-                      ... on ProjectV2FieldCommon {
-                        name
-                        id
-                      }
-                    }
-                  }
-                  ... on ProjectV2ItemFieldDateValue {
-                    date
-                    field {
-                      ... on ProjectV2FieldCommon {
-                        name
-                        id
-                      }
-                    }
-                  }
-                  ... on ProjectV2ItemFieldNumberValue {
-                    number
-                    field {
-                      ... on ProjectV2FieldCommon {
-                        name
-                        id
-                      }
-                    }
-                  }
-                  ... on ProjectV2ItemFieldSingleSelectValue {
-                    name
-                    field {
-                      ... on ProjectV2FieldCommon {
-                        name
-                        id
-                      }
-                    }
-                  }
-                  ... on ProjectV2ItemFieldIterationValue {
-                    title
-                    field {
-                      ... on ProjectV2FieldCommon {
-                        name
-                        id
-                      }
-                    }
-                  }
-                }
-              }
-              content {
-                __typename
-                ... on Issue {
-                  id
-                  number
-                  title
-                  repository {
-                    name
-                    owner {
-                      login
-                    }
-                  }
-                }
-              }
-            }
-          }
-        }
-      }
-    }
-    """
-
-    try:
-        result = graphql(query, {"projectId": project_id})
-        items = result["node"]["items"]["nodes"]
-        logger.info(f"Found {len(items)} items")
-        return items
-    except Exception as e:
-        logger.error(f"Error fetching project items: {e}")
-        raise
+def issue_key(item):
+    """Key identifying the issue of a project item across projects, None for non issues"""
+    if not item.get("content") or item["content"].get("__typename") != "Issue":
+        return None
+    issue = item["content"]
+    return (issue["repository"]["owner"]["login"], issue["repository"]["name"], issue["number"])
 
 
 def find_matching_items(source_items, target_items):
@@ -197,175 +39,75 @@ def find_matching_items(source_items, target_items):
     logger.info("Finding matching items between projects")
     matches = []
 
+    # Index the target issues once, keeping the first item of each issue
+    target_index = {}
+    for target_item in target_items:
+        key = issue_key(target_item)
+        if key is not None:
+            target_index.setdefault(key, target_item)
+
     for source_item in source_items:
+        key = issue_key(source_item)
         # Skip items that aren't issues
-        if not source_item.get("content") or source_item["content"].get("__typename") != "Issue":
-            logger.debug("item type is not Issue, skipping ", source_item["content"].get("__typename") if source_item.get("content") else "")
+        if key is None:
+            logger.debug("item type is not Issue, skipping %s", source_item["content"].get("__typename") if source_item.get("content") else "")
             continue
 
-        source_issue = source_item["content"]
-
-        # Find the same issue in target project
-        for target_item in target_items:
-            if not target_item.get("content") or target_item["content"].get("__typename") != "Issue":
-                continue
-
-            target_issue = target_item["content"]
-
-            # Match based on issue number and repository
-            if (target_issue["number"] == source_issue["number"] and
-                target_issue["repository"]["name"] == source_issue["repository"]["name"] and
-                target_issue["repository"]["owner"]["login"] == source_issue["repository"]["owner"]["login"]):
-
-                matches.append({
-                    "sourceItem": source_item,
-                    "targetItem": target_item
-                })
-                break
+        target_item = target_index.get(key)
+        if target_item is not None:
+            matches.append({
+                "sourceItem": source_item,
+                "targetItem": target_item
+            })
 
     logger.info(f"Found {len(matches)} matching items")
     return matches
 
 
-def find_field_by_name(fields, field_name):
-    """Find a field by name in a list of fields"""
-    for field in fields:
-        if field.get("name", "").lower() == field_name.lower():
-            return field
-    return None
-
-
-def find_option_by_name(field, option_name):
-    """Find a select option by name"""
-    if not field.get("options") or not isinstance(field["options"], list):
-        return None
-
-    for option in field["options"]:
-        if option.get("name", "").lower() == option_name.lower():
-            return option
-    return None
-
-
-def update_field_value(project_id, item_id, field_id, field, value):
-    """Update a field value"""
-    field_type = field.get("dataType", "").upper()
-
+def update_field_value(project_id, item_id, mapping, value):
+    """Update a field value with the prebuilt mutation of its compiled field mapping"""
     variables = {
         "projectId": project_id,
         "itemId": item_id,
-        "fieldId": field_id
+        "fieldId": mapping.field_id,
+        mapping.variable: value
     }
 
-    # Handle different field types
-    if field_type == "SINGLE_SELECT":
-        mutation = """
-        mutation($projectId: ID!, $itemId: ID!, $fieldId: ID!, $optionId: String!) {
-          updateProjectV2ItemFieldValue(input: {
-            projectId: $projectId
-            itemId: $itemId
-            fieldId: $fieldId
-            value: { singleSelectOptionId: $optionId }
-          }) {
-            projectV2Item {
-              id
-            }
-          }
-        }
-        """
-        variables["optionId"] = value
-
-    elif field_type == "NUMBER":
-        mutation = """
-        mutation($projectId: ID!, $itemId: ID!, $fieldId: ID!, $number: Float!) {
-          updateProjectV2ItemFieldValue(input: {
-            projectId: $projectId
-            itemId: $itemId
-            fieldId: $fieldId
-            value: { number: $number }
-          }) {
-            projectV2Item {
-              id
-            }
-          }
-        }
-        """
-        variables["number"] = float(value)
-
-    elif field_type == "ITERATION":
-        mutation = """
-        mutation($projectId: ID!, $itemId: ID!, $fieldId: ID!, $iterationId: String!) {
-          updateProjectV2ItemFieldValue(input: {
-            projectId: $projectId
-            itemId: $itemId
-            fieldId: $fieldId
-            value: { iterationId: $iterationId }
-          }) {
-            projectV2Item {
-              id
-            }
-          }
-        }   
-        """
-        variables["iterationId"] = value
-        logger.info("Updating iteration field with variables: %s", variables)
-
-    elif field_type == "TEXT":
-        mutation = """
-        mutation($projectId: ID!, $itemId: ID!, $fieldId: ID!, $text: String!) {
-          updateProjectV2ItemFieldValue(input: {
-            projectId: $projectId
-            itemId: $itemId
-            fieldId: $fieldId
-            value: { text: $text }
-          }) {
-            projectV2Item {
-              id
-            }
-          }
-        }
-        """
-        variables["text"] = value
-
-    else:
-        logger.error(f"Unsupported field type: {field_type}")
-        return False
-
     try:
-        graphql(mutation, variables)
+        graphql(mapping.mutation, variables)
         return True
     except Exception as e:
         logger.error(f"Error updating field value: {e}")
         return False
 
 
-def sync_project_attributes(source_project_number,target_project_number):
-    """Main function to synchronize project attributes"""
-    logger.info("Starting synchronization process")
-
-    # Get project IDs
-    source_project_id = get_project_id(source_project_number, ORG)
-    target_project_id = get_project_id(target_project_number, ORG)
-
-    if not source_project_id or not target_project_id:
-        logger.error("Could not find one of the projects. Check project numbers and organization names.")
-        return 1
+def get_field_values(item):
+    """Get the values of all the fields of a project item, by lower cased field name"""
+    values = {}
+    for node in item["fieldValues"]["nodes"]:
+        name = node.get("field", {}).get("name")
+        if not name:
+            continue
+        for key in ("text", "number", "date", "name", "title"):
+            if key in node:
+                values.setdefault(name.lower(), node[key])
+                break
+    return values
 
-    # Get fields for both projects
-    source_fields = get_project_fields(source_project_id)
-    target_fields = get_project_fields(target_project_id)
 
-    # Get items for both projects
-    source_items = get_project_items(source_project_id)
-    logger.debug("Source items: %s", source_items)
-    target_items = get_project_items(target_project_id)
-    logger.debug("Target items: %s", target_items)
+def plan_field_updates(source_fields, target_fields, source_items, target_items, mappings=None):
+    """Compute the field value updates needed to align target items on source items
 
-    # Find matching items
+    Works only on already fetched fields and items, so that it can run on
+    project snapshots without any network access. The field mappings are
+    compiled once, and values already identical in the target item are not
+    planned.
+    """
     matches = find_matching_items(source_items, target_items)
-
-    # Sync field values for each match
-    logger.info("Syncing field values")
-    sync_count = 0
+    field_mappings = compile_field_mappings(
+        FIELDS_TO_SYNC if mappings is None else mappings, source_fields, target_fields
+    )
+    updates = []
 
     for match in matches:
         source_item = match["sourceItem"]
@@ -375,78 +117,144 @@ def sync_project_attributes(source_project_number,target_project_number):
         issue_number = source_item["content"].get("number", "unknown")
         issue_title = source_item["content"].get("title", "unknown")
 
-        # Process each field to sync
-        for src_field_name, target_field_name in FIELDS_TO_SYNC.items():
-            # Find the field in source project
-            source_field = find_field_by_name(source_fields, src_field_name)
-            if not source_field:
-                logger.warning(f"Field '{src_field_name}' not found in source project, skipping")
-                continue
+        source_values = get_field_values(source_item)
+        target_values = None
+
+        for mapping in field_mappings:
+            source_value = source_values.get(mapping.source_name.lower())
 
-            # Find the field in target project
-            target_field = find_field_by_name(target_fields, target_field_name)
-            if not target_field:
-                logger.warning(f"Field '{target_field_name}' not found in target project, skipping")
+            if source_value is None:
+                logger.info(f"No value for field '{mapping.source_name}' in issue #{issue_number}, skipping")
                 continue
 
-            # Find the value in source item
-            source_value = None
-            field_value_type = None
-
-            for node in source_item["fieldValues"]["nodes"]:
-                if node.get("field", {}).get("name", "").lower() == src_field_name.lower():
-                    if "text" in node:
-                        source_value = node["text"]
-                        field_value_type = "text"
-                    elif "number" in node:
-                        source_value = node["number"]
-                        field_value_type = "number"
-                    elif "name" in node:
-                        source_value = node["name"]
-                        field_value_type = "name"
-                    elif "title" in node:
-                        source_value = node["title"]
-                        field_value_type = "title"
-                    break
+            try:
+                resolved = mapping.resolve(source_value)
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Value {source_value!r} of field '{mapping.source_name}' in issue #{issue_number} can not be mapped to '{mapping.target_name}': {e}, skipping")
+                continue
+            if resolved is None:
+                logger.warning(f"Option '{source_value}' not found in target field '{mapping.target_name}', skipping")
+                continue
+            display_value, value = resolved
 
-            if source_value is None:
-                logger.info(f"No value for field '{src_field_name}' in issue #{issue_number}, skipping")
+            if target_values is None:
+                target_values = get_field_values(target_item)
+            if target_values.get(mapping.target_name.lower()) == display_value:
+                logger.debug(f"'{mapping.target_name}' is up to date for issue #{issue_number}")
                 continue
 
-            # For single select fields, need to find the option ID in target field
-            if field_value_type == "name":
-                option_name = source_value
-                target_option = find_option_by_name(target_field, option_name)
-
-                if not target_option:
-                    logger.warning(f"Option '{option_name}' not found in target field '{target_field_name}', skipping")
-                    continue
-
-                source_value = target_option["id"]
-
-            # Update the target field
-            logger.info(f"Updating '{target_field_name}' for issue #{issue_number} '{issue_title}' in target project")
-            success = update_field_value(
-                target_project_id,
-                target_item["id"],
-                target_field["id"],
-                target_field,
-                source_value
-            )
-
-            if success:
-                sync_count += 1
-                logger.info(f"Successfully updated '{target_field_name}' for issue #{issue_number}")
-            else:
-                logger.warning(f"Failed to update '{target_field_name}' for issue #{issue_number}")
+            updates.append({
+                "itemId": target_item["id"],
+                "mapping": mapping,
+                "value": value,
+                "displayValue": display_value,
+                "issueNumber": issue_number,
+                "issueTitle": issue_title,
+            })
+
+    logger.info(f"Planned {len(updates)} field value updates")
+    return updates
+
+
+def sync_project_attributes(source_project_number, target_project_number,
+                            source_snapshot=None, target_snapshot=None, dry_run=False,
+                            mappings=None):
+    """Main function to synchronize project attributes
+
+    Projects are read from the snapshot files when given, instead of being
+    fetched from GitHub. With dry_run, the planned updates are only logged.
+    The field mappings default to the configured FIELDS_TO_SYNC.
+    """
+    logger.info("Starting synchronization process")
+
+    if source_snapshot:
+        source_project, source_fields, source_items = read_snapshot(source_snapshot)
+        source_project_id = source_project["id"]
+    else:
+        source_project_id = get_project_id(source_project_number, ORG)
+
+    if target_snapshot:
+        target_project, target_fields, target_items = read_snapshot(target_snapshot)
+        target_project_id = target_project["id"]
+    else:
+        target_project_id = get_project_id(target_project_number, ORG)
+
+    if not source_project_id or not target_project_id:
+        logger.error("Could not find one of the projects. Check project numbers and organization names.")
+        return 1
+
+    if not source_snapshot:
+        source_fields = get_project_fields(source_project_id)
+        source_items = get_project_items(source_project_id)
+    logger.debug("Source items: %s", source_items)
+
+    if not target_snapshot:
+        target_fields = get_project_fields(target_project_id)
+        target_items = get_project_items(target_project_id)
+    logger.debug("Target items: %s", target_items)
+
+    updates = plan_field_updates(source_fields, target_fields, source_items, target_items, mappings)
+
+    if dry_run:
+        for update in updates:
+            logger.info(f"Would update '{update['mapping'].target_name}' for issue #{update['issueNumber']} to {update['displayValue']!r}")
+        return 0
+
+    # Sync field values for each planned update
+    logger.info("Syncing field values")
+    sync_count = 0
+
+    for update in updates:
+        target_field_name = update["mapping"].target_name
+        issue_number = update["issueNumber"]
+
+        logger.info(f"Updating '{target_field_name}' for issue #{issue_number} '{update['issueTitle']}' in target project")
+        success = update_field_value(
+            target_project_id,
+            update["itemId"],
+            update["mapping"],
+            update["value"]
+        )
+
+        if success:
+            sync_count += 1
+            logger.info(f"Successfully updated '{target_field_name}' for issue #{issue_number}")
+        else:
+            logger.warning(f"Failed to update '{target_field_name}' for issue #{issue_number}")
 
     logger.info(f"Synchronization complete. Updated {sync_count} field values.")
     return 0
 
 
-def sync_hitide_soto_to_tva_attributes():
-    sync_project_attributes(67, 74)
-    sync_project_attributes(68, 74)
+def sync_hitide_soto_to_tva_attributes(argv=None):
+    """Synchronize the source to target pairs of the sync configuration"""
+    parser = argparse.ArgumentParser(description="Synchronize project attributes")
+    parser.add_argument("--source", type=int, help="Only synchronize from this project number")
+    parser.add_argument("--target", type=int, help="Only synchronize into this project number")
+    parser.add_argument("--source-snapshot", help="Read the source project from this snapshot")
+    parser.add_argument("--target-snapshot", help="Read the target project from this snapshot")
+    parser.add_argument("--dry-run", action="store_true", help="Only log the planned updates")
+    args = parser.parse_args(argv)
+
+    pairs = [
+        pair for pair in CONFIG.get("sync", [])
+        if args.source in (None, pair["source"]) and args.target in (None, pair["target"])
+    ]
+    if not pairs:
+        parser.error("No configured sync pair matches --source and --target")
+    if args.source_snapshot and len({pair["source"] for pair in pairs}) > 1:
+        parser.error("--source-snapshot requires --source to select a single source project")
+    if args.target_snapshot and len({pair["target"] for pair in pairs}) > 1:
+        parser.error("--target-snapshot requires --target to select a single target project")
+
+    status = 0
+    for pair in pairs:
+        status |= sync_project_attributes(
+            pair["source"], pair["target"],
+            source_snapshot=args.source_snapshot, target_snapshot=args.target_snapshot,
+            dry_run=args.dry_run, mappings=pair_field_mappings(CONFIG, pair)
+        )
+    return status
 
 if __name__ == "__main__":
     sys.exit(sync_hitide_soto_to_tva_attributes())
\ No newline at end of file
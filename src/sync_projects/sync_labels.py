@@ -0,0 +1,45 @@
+import os
+import sys
+import logging
+from .common import rest, rest_list
+from .discovery import list_repositories
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger("sync_labels")
+
+
+def sync_labels(source_repo, org):
+    """Create the labels of the source repository missing in the organization repositories"""
+    labels = rest_list(f"/repos/{source_repo}/labels")
+    logger.info(f"Found {len(labels)} labels in {source_repo}")
+
+    repos = [repo["full_name"] for repo in list_repositories(org, archived=False)]
+    failures = 0
+    for repo in repos:
+        # Label names are case insensitive on GitHub
+        existing = {label["name"].lower() for label in rest_list(f"/repos/{repo}/labels")}
+        for label in labels:
+            if label["name"].lower() in existing:
+                continue
+            logger.info(f"Creating label '{label['name']}' in {repo}")
+            try:
+                rest(f"/repos/{repo}/labels", method="POST", payload={
+                    "name": label["name"],
+                    "color": label["color"],
+                    "description": label.get("description") or "",
+                })
+            except Exception as e:
+                logger.warning(f"Failed to create label '{label['name']}' in {repo}: {e}")
+                failures += 1
+
+    logger.info(f"Label synchronization complete with {failures} failures")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(sync_labels(os.environ["SOURCE_REPO"], os.environ["ORG"]))
@@ -0,0 +1,51 @@
+import os
+import sys
+import logging
+from .common import rest, rest_list
+from .discovery import list_repositories
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger("sync_milestones")
+
+
+def sync_milestones(source_repo, org):
+    """Create the open milestones of the source repository missing in the organization repositories"""
+    milestones = rest_list(f"/repos/{source_repo}/milestones")
+    logger.info(f"Found {len(milestones)} milestones in {source_repo}")
+
+    repos = [repo["full_name"] for repo in list_repositories(org, archived=False)]
+    failures = 0
+    for repo in repos:
+        # Closed milestones are included, their titles can not be reused either
+        existing = {m["title"] for m in rest_list(f"/repos/{repo}/milestones?state=all")}
+        for milestone in milestones:
+            if milestone["title"] in existing:
+                logger.info(f"Milestone '{milestone['title']}' already exists in {repo}, skipping")
+                continue
+
+            payload = {
+                "title": milestone["title"],
+                "description": milestone.get("description") or "",
+                "state": milestone["state"],
+            }
+            if milestone.get("due_on"):
+                payload["due_on"] = milestone["due_on"]
+
+            logger.info(f"Creating milestone '{milestone['title']}' in {repo}")
+            try:
+                rest(f"/repos/{repo}/milestones", method="POST", payload=payload)
+            except Exception as e:
+                logger.warning(f"Failed to create milestone '{milestone['title']}' in {repo}: {e}")
+                failures += 1
+
+    logger.info(f"Milestone synchronization complete with {failures} failures")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(sync_milestones(os.environ["SOURCE_REPO"], os.environ["ORG"]))
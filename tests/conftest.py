@@ -0,0 +1,18 @@
+def make_item(number, status=None, estimate=None, iteration=None, ref=None,
+              item_id=None, iteration_field="Iteration"):
+    """Build a project item of an issue, shaped like the GraphQL response"""
+    nodes = []
+    if status is not None:
+        nodes.append({"name": status, "field": {"name": "Status", "id": "F_STATUS"}})
+    if estimate is not None:
+        nodes.append({"number": estimate, "field": {"name": "Estimate", "id": "F_ESTIMATE"}})
+    if iteration is not None:
+        nodes.append({"title": iteration, "field": {"name": iteration_field, "id": "F_ITERATION"}})
+    if ref is not None:
+        nodes.append({"text": ref, "field": {"name": "PCESA Ref", "id": "F_REF"}})
+    return {
+        "id": item_id or f"ITEM_{number}",
+        "fieldValues": {"nodes": nodes},
+        "content": {"__typename": "Issue", "id": f"I_{number}", "number": number, "title": f"Issue {number}",
+                    "repository": {"name": "repo", "owner": {"login": "podaac"}}},
+    }
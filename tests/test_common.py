@@ -0,0 +1,113 @@
+import json
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from src.sync_projects import common
+from src.sync_projects.common import rest, rest_list
+
+API = "https://api.test"
+
+
+class FakeGitHub:
+    """REST API serving lists of elements by pages, with an ETag per page"""
+
+    def __init__(self, elements, per_page=100):
+        self.elements = elements
+        self.per_page = per_page
+        self.requests = []
+
+    def request(self, method, url, headers=None, json=None):
+        page = int(parse_qs(urlparse(url).query).get("page", ["1"])[0])
+        body = self.elements[(page - 1) * self.per_page:page * self.per_page]
+        etag = f'"{hash(tuple(body))}"'
+        conditional = headers.get("If-None-Match") == etag
+        self.requests.append((url, "304" if conditional else "200"))
+
+        response = requests.Response()
+        response.url = url
+        response.headers = CaseInsensitiveDict({"ETag": etag})
+        if page * self.per_page < len(self.elements):
+            response.headers["Link"] = f'<{API}/items?per_page={self.per_page}&page={page + 1}>; rel="next"'
+        if conditional:
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response._content = encode(body)
+        return response
+
+
+def encode(body):
+    return json.dumps(body).encode("utf-8")
+
+
+@pytest.fixture
+def github(monkeypatch):
+    monkeypatch.setenv("GITHUB_TOKEN", "token")
+    monkeypatch.setattr(common, "REST_API", API)
+    server = FakeGitHub(list(range(250)))
+    monkeypatch.setattr(common, "_session", server)
+    return server
+
+
+def test_unchanged_pages_are_served_from_the_cache(github, tmp_path):
+    assert rest_list("/items", cache_dir=str(tmp_path)) == list(range(250))
+    assert [status for _, status in github.requests] == ["200", "200", "200"]
+
+    github.requests.clear()
+    assert rest_list("/items", cache_dir=str(tmp_path)) == list(range(250))
+    assert [status for _, status in github.requests] == ["304", "304", "304"]
+
+
+def test_changed_pages_are_fetched_again(github, tmp_path):
+    rest_list("/items", cache_dir=str(tmp_path))
+    github.elements[0] = "changed"
+    github.requests.clear()
+    assert rest_list("/items", cache_dir=str(tmp_path))[0] == "changed"
+    assert [status for _, status in github.requests] == ["200", "304", "304"]
+
+
+def test_new_page_after_a_full_last_page_is_not_missed(github, tmp_path):
+    github.elements = list(range(200))
+    rest_list("/items", cache_dir=str(tmp_path))
+
+    # The first two pages are unchanged, but a third page now follows them
+    github.elements.append(200)
+    github.requests.clear()
+    assert rest_list("/items", cache_dir=str(tmp_path)) == list(range(201))
+    assert len(github.requests) == 3
+
+
+def test_full_last_page_is_fetched_again_without_link_on_304(github, tmp_path, monkeypatch):
+    github.elements = list(range(200))
+    rest_list("/items", cache_dir=str(tmp_path))
+    github.elements.append(200)
+
+    # Servers may omit the Link header on a 304
+    request = github.request
+
+    def request_without_link(*args, **kwargs):
+        response = request(*args, **kwargs)
+        if response.status_code == 304:
+            response.headers.pop("Link", None)
+        return response
+
+    monkeypatch.setattr(common._session, "request", request_without_link)
+    github.requests.clear()
+    assert rest_list("/items", cache_dir=str(tmp_path)) == list(range(201))
+    assert [status for _, status in github.requests] == ["304", "304", "200", "200"]
+
+
+def test_requests_are_not_cached_without_cache_dir(github, monkeypatch):
+    monkeypatch.setattr(common, "HTTP_CACHE_DIR", None)
+    rest_list("/items")
+    rest_list("/items")
+    assert [status for _, status in github.requests] == ["200"] * 6
+
+
+def test_rest_returns_the_body(github, tmp_path):
+    github.elements = ["a", "b"]
+    assert rest("/items?per_page=100", cache_dir=str(tmp_path)) == ["a", "b"]
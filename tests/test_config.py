@@ -0,0 +1,103 @@
+import pytest
+
+from src.sync_projects.config import MUTATIONS, compile_field_mappings, load_config, pair_field_mappings
+
+SOURCE_FIELDS = [{"name": "Status"}, {"name": "Estimate"}, {"name": "Sprint"}, {"name": "Title"}]
+TARGET_FIELDS = [
+    {"id": "T_STATUS", "name": "Status", "dataType": "SINGLE_SELECT",
+     "options": [{"id": "T_PROGRESS", "name": "In Progress"}, {"id": "T_DONE", "name": "Done"}]},
+    {"id": "T_ESTIMATE", "name": "Estimate", "dataType": "NUMBER"},
+    {"id": "T_ITERATION", "name": "Iteration", "dataType": "ITERATION",
+     "configuration": {"iterations": [{"id": "IT_2", "title": "Sprint 2"}],
+                       "completedIterations": [{"id": "IT_1", "title": "Sprint 1"}]}},
+    {"id": "T_NOTES", "name": "Notes", "dataType": "TEXT"},
+    {"id": "T_REVIEWERS", "name": "Reviewers", "dataType": "USERS"},
+]
+
+
+def write_config(tmp_path, content):
+    path = tmp_path / "sync_config.toml"
+    path.write_text(content)
+    return str(path)
+
+
+def test_default_config_loads():
+    config = load_config()
+    assert config["org"] == "podaac"
+    assert [(pair["source"], pair["target"]) for pair in config["sync"]] == [(67, 74), (68, 74)]
+    assert pair_field_mappings(config, config["sync"][0]) == config["fields"]
+
+
+def test_pair_fields_override_default_fields(tmp_path):
+    config = load_config(write_config(tmp_path, """
+[[sync]]
+source = 1
+target = 2
+fields = [{source = "Status", target = "Status"}]
+
+[[fields]]
+source = "Estimate"
+target = "Estimate"
+"""))
+    assert pair_field_mappings(config, config["sync"][0]) == [{"source": "Status", "target": "Status"}]
+
+
+@pytest.mark.parametrize("content", [
+    # Unknown transform in the default fields, without any sync pair
+    '[[fields]]\nsource = "Status"\ntarget = "Status"\ntransform = "reverse"\n',
+    '[[fields]]\nsource = "Status"\n',
+    '[[fields]]\ntarget = "Status"\n',
+    '[[fields]]\nsource = "Status"\ntarget = "Status"\naliases = "WIP"\n',
+    'fields = ["Status"]\n',
+    '[[sync]]\nsource = 1\n',
+    '[[sync]]\nsource = 1\ntarget = 2\nfields = [{source = "Status"}]\n',
+])
+def test_invalid_config_is_rejected(tmp_path, content):
+    with pytest.raises(ValueError):
+        load_config(write_config(tmp_path, content))
+
+
+def test_compile_resolves_options_aliases_and_iterations():
+    status, estimate, iteration = compile_field_mappings([
+        {"source": "Status", "target": "Status", "aliases": {"WIP": "In Progress", "Gone": "Missing"}},
+        {"source": "Estimate", "target": "Estimate", "transform": "round"},
+        {"source": "Sprint", "target": "Iteration"},
+    ], SOURCE_FIELDS, TARGET_FIELDS)
+
+    assert status.resolve("done") == ("Done", "T_DONE")
+    assert status.resolve("WIP") == ("In Progress", "T_PROGRESS")
+    assert status.resolve("Gone") is None
+    assert estimate.resolve(2.6) == (3.0, 3.0)
+    assert iteration.resolve("Sprint 1") == ("Sprint 1", "IT_1")
+    assert iteration.resolve("Sprint 3") is None
+
+
+def test_compile_uses_prebuilt_mutations():
+    mapping, = compile_field_mappings([{"source": "Estimate", "target": "Estimate"}], SOURCE_FIELDS, TARGET_FIELDS)
+    assert (mapping.mutation, mapping.variable) == MUTATIONS["NUMBER"][:2]
+    assert "value: { number: $number }" in mapping.mutation
+
+
+def test_compile_skips_transforms_not_fitting_the_target_type():
+    assert compile_field_mappings([
+        {"source": "Estimate", "target": "Estimate", "transform": "lower"},
+        {"source": "Title", "target": "Notes", "transform": "round"},
+    ], SOURCE_FIELDS, TARGET_FIELDS) == []
+
+
+def test_compile_skips_missing_and_unsupported_fields():
+    assert compile_field_mappings([
+        {"source": "Missing", "target": "Status"},
+        {"source": "Status", "target": "Missing"},
+        {"source": "Title", "target": "Reviewers"},
+    ], SOURCE_FIELDS, TARGET_FIELDS) == []
+
+
+def test_resolve_raises_on_values_not_fitting_the_target_type():
+    notes, estimate = compile_field_mappings([
+        {"source": "Title", "target": "Notes", "transform": "upper"},
+        {"source": "Title", "target": "Estimate"},
+    ], SOURCE_FIELDS, TARGET_FIELDS)
+    assert notes.resolve(" a ") == (" A ", " A ")
+    with pytest.raises(ValueError):
+        estimate.resolve("not a number")
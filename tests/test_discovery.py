@@ -0,0 +1,103 @@
+import json
+
+import pytest
+
+from src.sync_projects import discovery
+from src.sync_projects.discovery import find_project, get_project_index, list_projects, list_repositories
+
+REPOS = [
+    {"name": "tva-meta", "full_name": "podaac/tva-meta", "archived": False, "topics": ["tva"]},
+    {"name": "tva-old", "full_name": "podaac/tva-old", "archived": True, "topics": ["tva"]},
+    {"name": "hitide", "full_name": "podaac/hitide", "archived": False, "topics": []},
+]
+
+PAGES = {
+    None: ({"hasNextPage": True, "endCursor": "c1"},
+           [{"id": "P1", "number": 1, "title": "tva", "closed": False}]),
+    "c1": ({"hasNextPage": False, "endCursor": None},
+           [{"id": "P74", "number": 74, "title": "TVA board", "closed": False},
+            {"id": "P2", "number": 2, "title": "tva", "closed": True}]),
+}
+
+
+@pytest.fixture
+def github(monkeypatch, tmp_path):
+    queries = []
+
+    def graphql(query, variables):
+        queries.append(variables)
+        page_info, nodes = PAGES[variables["after"]]
+        return {"organization": {"projectsV2": {"pageInfo": page_info, "nodes": nodes}}}
+
+    monkeypatch.setattr(discovery, "graphql", graphql)
+    monkeypatch.setattr(discovery, "rest_list", lambda path: REPOS)
+    monkeypatch.setattr(discovery, "HTTP_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(discovery, "_project_indexes", {})
+    monkeypatch.setattr(discovery, "_listed_orgs", set())
+    return queries
+
+
+def new_run(monkeypatch):
+    monkeypatch.setattr(discovery, "_project_indexes", {})
+    monkeypatch.setattr(discovery, "_listed_orgs", set())
+
+
+@pytest.mark.parametrize("filters, names", [
+    ({}, ["tva-meta", "tva-old", "hitide"]),
+    ({"archived": False}, ["tva-meta", "hitide"]),
+    ({"archived": True}, ["tva-old"]),
+    ({"topic": "tva"}, ["tva-meta", "tva-old"]),
+    ({"pattern": "tva-*", "archived": False}, ["tva-meta"]),
+])
+def test_list_repositories_filters(github, filters, names):
+    assert [repo["name"] for repo in list_repositories("podaac", **filters)] == names
+
+
+def test_list_projects_follows_the_cursor(github):
+    assert [project["id"] for project in list_projects("podaac")] == ["P1", "P74", "P2"]
+    assert [query["after"] for query in github] == [None, "c1"]
+
+
+def test_project_index_keeps_the_first_project_of_a_title(github):
+    assert get_project_index("podaac")["tva"] == {"number": 1, "id": "P1", "closed": False}
+
+
+def test_project_index_is_persisted_between_runs(github, monkeypatch):
+    get_project_index("podaac")
+    new_run(monkeypatch)
+    assert find_project("podaac", "TVA board")["id"] == "P74"
+    assert len(github) == 2
+
+
+def test_expired_project_index_is_listed_again(github, monkeypatch):
+    get_project_index("podaac")
+    new_run(monkeypatch)
+    monkeypatch.setattr(discovery, "PROJECT_INDEX_MAX_AGE", -1)
+    get_project_index("podaac")
+    assert len(github) == 4
+
+
+@pytest.mark.parametrize("content", ['{"fetchedAt": 1', '{"projects": {}}', "[]"])
+def test_invalid_project_index_is_a_cache_miss(github, tmp_path, content):
+    (tmp_path / "projects-podaac.json").write_text(content)
+    assert get_project_index("podaac")["TVA board"]["number"] == 74
+    with open(tmp_path / "projects-podaac.json") as f:
+        assert json.load(f)["projects"]["TVA board"]["id"] == "P74"
+
+
+def test_missing_titles_list_the_projects_at_most_once_per_run(github, monkeypatch):
+    get_project_index("podaac")
+    new_run(monkeypatch)
+
+    # The persisted index misses the title, the projects are listed once
+    assert find_project("podaac", "missing") is None
+    assert len(github) == 4
+    assert find_project("podaac", "other missing") is None
+    assert find_project("podaac", "tva")["id"] == "P1"
+    assert len(github) == 4
+
+
+def test_main_finds_a_project(github, capsys):
+    assert discovery.main(["podaac", "--find", "TVA board"]) == 0
+    assert capsys.readouterr().out == "74\tP74\n"
+    assert discovery.main(["podaac", "--find", "missing"]) == 1
@@ -0,0 +1,111 @@
+import csv
+import json
+
+from conftest import make_item
+from src.sync_projects import report
+from src.sync_projects.report import NO_VALUE, build_report
+from src.sync_projects.snapshot import pack_item, write_snapshot
+
+FIELDS = [
+    {"id": "F_ITERATION", "name": "Iteration", "dataType": "ITERATION",
+     "configuration": {
+         "iterations": [{"id": "IT_2", "title": "Sprint 2", "startDate": "2026-01-15", "duration": 14}],
+         "completedIterations": [{"id": "IT_1", "title": "Sprint 1", "startDate": "2026-01-01", "duration": 14}],
+     }},
+]
+
+ISSUES = [
+    make_item(1, "Done", 3, "Sprint 2", "ESDIS-1"),
+    make_item(2, "Todo", 5, "Sprint 2", "ESDIS-1"),
+    make_item(3, "Done", 2, "Sprint 1", "ESDIS-1"),
+    make_item(4, "Todo", 1, None, "ESDIS-1"),
+    make_item(5, "Todo", 4, "Sprint 9", "ESDIS-1"),
+    make_item(6, None, None, "Sprint 1"),
+]
+ITEMS = [pack_item(item) for item in ISSUES]
+
+
+def test_status_counts_and_totals():
+    result = build_report([(FIELDS, ITEMS)], "F_REF")
+    assert result["items"] == 6
+    assert result["estimateTotal"] == 15
+    assert result["status"] == [
+        {"status": "Todo", "items": 3, "estimate": 10},
+        {"status": "Done", "items": 2, "estimate": 5},
+        {"status": NO_VALUE, "items": 1, "estimate": 0},
+    ]
+
+
+def test_burndown_follows_iteration_start_dates():
+    result = build_report([(FIELDS, ITEMS)], "PCESA Ref")
+    rows = [(r["esdisRef"], r["iteration"], r["doneEstimate"], r["remainingEstimate"])
+            for r in result["burndown"]]
+    assert rows == [
+        (NO_VALUE, "Sprint 1", 0, 0),
+        # Dated iterations first, then unknown iterations, then unscheduled items
+        ("ESDIS-1", "Sprint 1", 2, 13),
+        ("ESDIS-1", "Sprint 2", 3, 10),
+        ("ESDIS-1", "Sprint 9", 0, 10),
+        ("ESDIS-1", NO_VALUE, 0, 10),
+    ]
+
+
+def test_first_board_wins_for_shared_issues():
+    source_items = [pack_item(make_item(1, "Todo", 8, "Sprint 2", "ESDIS-1")), pack_item(make_item(7, "Todo", 1))]
+    result = build_report([(FIELDS, ITEMS), ([], source_items)], "F_REF")
+    assert result["items"] == 7
+    assert result["estimateTotal"] == 16
+
+
+def test_main_creates_snapshot_dir_and_uses_fetched_board(tmp_path, monkeypatch):
+    snapshot_dir = tmp_path / "snapshots" / "nested"
+    exported = []
+
+    def export(project_number, org, path):
+        exported.append((project_number, path))
+        return {"number": project_number, "id": "P"}, FIELDS, ISSUES
+
+    def read(path):
+        raise AssertionError("the fetched board should not be read back")
+
+    monkeypatch.setattr(report, "export_project_snapshot", export)
+    monkeypatch.setattr(report, "read_snapshot", read)
+    output = tmp_path / "burndown.csv"
+
+    assert report.main(["--project", "74", "--snapshot-dir", str(snapshot_dir),
+                        "--ref-field", "F_REF", "--format", "csv", "--output", str(output)]) == 0
+    assert snapshot_dir.is_dir()
+    assert exported == [(74, str(snapshot_dir / "project-74.jsonl.gz"))]
+    with open(output, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["iteration"] for row in rows if row["esdisRef"] == "ESDIS-1"][:2] == ["Sprint 1", "Sprint 2"]
+
+
+def test_main_reads_cached_snapshots(tmp_path, monkeypatch):
+    write_snapshot(str(tmp_path / "project-74.jsonl.gz"), {"number": 74, "id": "P"}, FIELDS, ISSUES)
+    monkeypatch.setattr(report, "export_project_snapshot", None)
+    output = tmp_path / "report.json"
+
+    assert report.main(["--project", "74", "--snapshot-dir", str(tmp_path),
+                        "--ref-field", "F_REF", "--output", str(output)]) == 0
+    with open(output) as f:
+        assert json.load(f)["items"] == 6
+
+
+def test_main_fetches_the_board_again_when_the_snapshot_is_unreadable(tmp_path, monkeypatch):
+    snapshot = tmp_path / "project-74.jsonl.gz"
+    snapshot.write_bytes(b"\x1f\x8b truncated")
+    exported = []
+
+    def export(project_number, org, path):
+        exported.append(path)
+        return {"number": project_number, "id": "P"}, FIELDS, ISSUES
+
+    monkeypatch.setattr(report, "export_project_snapshot", export)
+    output = tmp_path / "report.json"
+
+    assert report.main(["--project", "74", "--snapshot-dir", str(tmp_path),
+                        "--ref-field", "F_REF", "--output", str(output)]) == 0
+    assert exported == [str(snapshot)]
+    with open(output) as f:
+        assert json.load(f)["items"] == 6
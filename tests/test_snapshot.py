@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from src.sync_projects.snapshot import pack_item, read_snapshot, write_snapshot
+
+PROJECT = {"number": 74, "id": "PVT_74"}
+FIELDS = [
+    {"id": "F_STATUS", "name": "Status", "dataType": "SINGLE_SELECT",
+     "options": [{"id": "O_TODO", "name": "Todo"}, {"id": "O_DONE", "name": "Done"}]},
+    {"id": "F_ESTIMATE", "name": "Estimate", "dataType": "NUMBER"},
+]
+ITEMS = [
+    {
+        "id": "ITEM_1",
+        "fieldValues": {"nodes": [
+            {"name": "Done", "field": {"name": "Status", "id": "F_STATUS"}},
+            {"number": 3.0, "field": {"name": "Estimate", "id": "F_ESTIMATE"}},
+            {"text": "ESDIS-1", "field": {"name": "PCESA Ref", "id": "F_REF"}},
+            {"title": "Sprint 1", "field": {"name": "Iteration", "id": "F_IT"}},
+            {"date": "2026-01-01", "field": {"name": "Due", "id": "F_DUE"}},
+        ]},
+        "content": {"__typename": "Issue", "id": "I_1", "number": 1, "title": "One",
+                    "repository": {"name": "repo", "owner": {"login": "podaac"}}},
+    },
+    {
+        "id": "ITEM_2",
+        "fieldValues": {"nodes": []},
+        "content": {"__typename": "DraftIssue"},
+    },
+]
+
+
+@pytest.mark.parametrize("name", ["project.jsonl", "project.jsonl.gz"])
+def test_round_trip(tmp_path, name):
+    path = str(tmp_path / name)
+    write_snapshot(path, PROJECT, FIELDS, ITEMS)
+    project, fields, items = read_snapshot(path)
+    assert project == PROJECT
+    assert fields == FIELDS
+    assert items == ITEMS
+
+
+def test_read_rejects_other_files(tmp_path):
+    path = tmp_path / "other.jsonl"
+    path.write_text(json.dumps({"schema": "something else"}) + "\n")
+    with pytest.raises(ValueError):
+        read_snapshot(str(path))
+
+
+def test_read_rejects_other_versions(tmp_path):
+    path = str(tmp_path / "project.jsonl")
+    write_snapshot(path, PROJECT, FIELDS, ITEMS)
+    with open(path) as f:
+        lines = f.readlines()
+    header = json.loads(lines[0])
+    header["version"] = 999
+    with open(path, "w") as f:
+        f.writelines([json.dumps(header) + "\n"] + lines[1:])
+    with pytest.raises(ValueError):
+        read_snapshot(path)
+
+
+def test_read_rejects_truncated_snapshots(tmp_path):
+    path = str(tmp_path / "project.jsonl")
+    write_snapshot(path, PROJECT, FIELDS, ITEMS)
+    with open(path) as f:
+        lines = f.readlines()
+    with open(path, "w") as f:
+        f.writelines(lines[:-1])
+    with pytest.raises(ValueError):
+        read_snapshot(path)
+
+
+def test_write_replaces_snapshots_atomically(tmp_path):
+    path = str(tmp_path / "project.jsonl.gz")
+    write_snapshot(path, PROJECT, FIELDS, ITEMS)
+    write_snapshot(path, PROJECT, FIELDS, ITEMS[:1])
+    assert read_snapshot(path)[2] == ITEMS[:1]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["project.jsonl.gz"]
+
+
+def test_read_packed_items(tmp_path):
+    path = str(tmp_path / "project.jsonl.gz")
+    write_snapshot(path, PROJECT, FIELDS, ITEMS)
+    items = read_snapshot(path, packed=True)[2]
+    assert items == [pack_item(item) for item in ITEMS]
+    assert items[0]["values"][0] == ["Status", "F_STATUS", "name", "Done"]
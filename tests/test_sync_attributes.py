@@ -0,0 +1,128 @@
+import pytest
+
+from conftest import make_item
+from src.sync_projects import sync_attributes
+from src.sync_projects.snapshot import write_snapshot
+from src.sync_projects.sync_attributes import find_matching_items, plan_field_updates
+
+SOURCE_FIELDS = [
+    {"id": "S_STATUS", "name": "Status", "dataType": "SINGLE_SELECT",
+     "options": [{"id": "S_TODO", "name": "Todo"}, {"id": "S_DONE", "name": "Done"}]},
+    {"id": "S_ESTIMATE", "name": "Estimate", "dataType": "NUMBER"},
+    {"id": "S_SPRINT", "name": "Sprint", "dataType": "ITERATION"},
+]
+TARGET_FIELDS = [
+    {"id": "T_STATUS", "name": "Status", "dataType": "SINGLE_SELECT",
+     "options": [{"id": "T_TODO", "name": "Todo"}, {"id": "T_DONE", "name": "Done"}]},
+    {"id": "T_ESTIMATE", "name": "Estimate", "dataType": "NUMBER"},
+    {"id": "T_ITERATION", "name": "Iteration", "dataType": "ITERATION",
+     "configuration": {
+         "iterations": [{"id": "IT_2", "title": "Sprint 2", "startDate": "2026-01-15", "duration": 14}],
+         "completedIterations": [{"id": "IT_1", "title": "Sprint 1", "startDate": "2026-01-01", "duration": 14}],
+     }},
+]
+
+
+def test_find_matching_items_matches_on_repository_and_number():
+    source = [make_item(1, item_id="S1"), make_item(2, item_id="S2"),
+              {"id": "S3", "content": {"__typename": "DraftIssue"}}]
+    target = [make_item(2, item_id="T2"), make_item(2, item_id="T2bis"), make_item(4, item_id="T4")]
+    matches = find_matching_items(source, target)
+    assert [(m["sourceItem"]["id"], m["targetItem"]["id"]) for m in matches] == [("S2", "T2")]
+
+
+def test_plan_field_updates_resolves_target_ids():
+    source = [make_item(1, "Done", 3, "Sprint 1", item_id="S1", iteration_field="Sprint")]
+    target = [make_item(1, "Todo", 2, "Sprint 2", item_id="T1")]
+    updates = plan_field_updates(SOURCE_FIELDS, TARGET_FIELDS, source, target)
+    assert {(u["itemId"], u["mapping"].field_id, u["value"]) for u in updates} == {
+        ("T1", "T_STATUS", "T_DONE"),
+        ("T1", "T_ESTIMATE", 3.0),
+        ("T1", "T_ITERATION", "IT_1"),
+    }
+
+
+def test_plan_field_updates_skips_values_already_up_to_date():
+    source = [make_item(1, "Done", 3, "Sprint 1", item_id="S1", iteration_field="Sprint")]
+    target = [make_item(1, "Done", 3.0, "Sprint 1", item_id="T1")]
+    assert plan_field_updates(SOURCE_FIELDS, TARGET_FIELDS, source, target) == []
+
+
+def test_plan_field_updates_skips_unknown_options():
+    source = [make_item(1, "Blocked", item_id="S1")]
+    target = [make_item(1, "Todo", item_id="T1")]
+    assert plan_field_updates(SOURCE_FIELDS, TARGET_FIELDS, source, target) == []
+
+
+def test_dry_run_on_snapshots_works_offline(tmp_path, monkeypatch, caplog):
+    caplog.set_level("INFO")
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    monkeypatch.delenv("PROJECTS_TOKEN", raising=False)
+
+    def no_network(*args, **kwargs):
+        raise AssertionError("no request expected")
+
+    monkeypatch.setattr(sync_attributes, "graphql", no_network)
+    source_path = str(tmp_path / "source.jsonl")
+    target_path = str(tmp_path / "target.jsonl.gz")
+    write_snapshot(source_path, {"number": 67, "id": "P67"}, SOURCE_FIELDS,
+                   [make_item(1, "Done", 3, "Sprint 1", item_id="S1", iteration_field="Sprint")])
+    write_snapshot(target_path, {"number": 74, "id": "P74"}, TARGET_FIELDS,
+                   [make_item(1, "Todo", 3, "Sprint 1", item_id="T1")])
+
+    assert sync_attributes.sync_project_attributes(
+        67, 74, source_snapshot=source_path, target_snapshot=target_path, dry_run=True
+    ) == 0
+    assert "Would update 'Status' for issue #1 to 'Done'" in caplog.text
+    assert "Would update 'Estimate'" not in caplog.text
+
+
+def test_command_line_dry_run_on_snapshots(tmp_path, monkeypatch, caplog):
+    caplog.set_level("INFO")
+    monkeypatch.setattr(sync_attributes, "graphql", None)
+    source_path = str(tmp_path / "source.jsonl")
+    target_path = str(tmp_path / "target.jsonl")
+    write_snapshot(source_path, {"number": 67, "id": "P67"}, SOURCE_FIELDS,
+                   [make_item(1, item_id="S1", iteration="Sprint 1", iteration_field="Sprint")])
+    write_snapshot(target_path, {"number": 74, "id": "P74"}, TARGET_FIELDS,
+                   [make_item(1, item_id="T1", iteration="Sprint 2")])
+
+    assert sync_attributes.sync_hitide_soto_to_tva_attributes([
+        "--source", "67", "--source-snapshot", source_path,
+        "--target-snapshot", target_path, "--dry-run",
+    ]) == 0
+    assert "Would update 'Iteration' for issue #1 to 'Sprint 1'" in caplog.text
+
+
+def test_command_line_requires_a_single_source_with_a_source_snapshot():
+    with pytest.raises(SystemExit):
+        sync_attributes.sync_hitide_soto_to_tva_attributes(["--source-snapshot", "source.jsonl", "--dry-run"])
+
+
+def test_plan_field_updates_skips_values_not_fitting_the_target():
+    source_fields = SOURCE_FIELDS + [{"id": "S_SIZE", "name": "Size", "dataType": "TEXT"}]
+    source = [make_item(1, item_id="S1", estimate=3)]
+    source[0]["fieldValues"]["nodes"].append({"text": "large", "field": {"name": "Size"}})
+    target = [make_item(1, item_id="T1", estimate=2)]
+    mappings = [
+        {"source": "Size", "target": "Estimate"},
+        {"source": "Estimate", "target": "Estimate", "transform": "lower"},
+    ]
+    assert plan_field_updates(source_fields, TARGET_FIELDS, source, target, mappings) == []
+
+
+def test_sync_sends_the_prebuilt_mutation(monkeypatch):
+    source = [make_item(1, "Done", 3, item_id="S1")]
+    target = [make_item(1, "Todo", 3, item_id="T1")]
+    requests = []
+    monkeypatch.setattr(sync_attributes, "get_project_id", lambda number, org=None: f"P{number}")
+    monkeypatch.setattr(sync_attributes, "get_project_fields",
+                        lambda project_id: SOURCE_FIELDS if project_id == "P67" else TARGET_FIELDS)
+    monkeypatch.setattr(sync_attributes, "get_project_items",
+                        lambda project_id: source if project_id == "P67" else target)
+    monkeypatch.setattr(sync_attributes, "graphql", lambda query, variables: requests.append((query, variables)))
+
+    assert sync_attributes.sync_project_attributes(67, 74) == 0
+    (query, variables), = requests
+    assert "singleSelectOptionId: $optionId" in query
+    assert variables == {"projectId": "P74", "itemId": "T1", "fieldId": "T_STATUS", "optionId": "T_DONE"}
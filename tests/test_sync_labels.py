@@ -0,0 +1,29 @@
+from src.sync_projects import sync_labels, sync_milestones
+
+REPOS = [{"full_name": "podaac/a"}, {"full_name": "podaac/b"}]
+
+
+def fail_on(repo):
+    def rest(path, method="GET", payload=None):
+        if path.startswith(f"/repos/{repo}/"):
+            raise RuntimeError("422 Unprocessable Entity")
+    return rest
+
+
+def test_label_failures_set_the_exit_code(monkeypatch):
+    monkeypatch.setattr(sync_labels, "list_repositories", lambda org, archived: REPOS)
+    monkeypatch.setattr(sync_labels, "rest_list", lambda path: [{"name": "bug", "color": "d73a4a"}]
+                        if path == "/repos/podaac/source/labels" else [])
+    monkeypatch.setattr(sync_labels, "rest", fail_on("podaac/b"))
+    assert sync_labels.sync_labels("podaac/source", "podaac") == 1
+
+    monkeypatch.setattr(sync_labels, "rest", fail_on("podaac/c"))
+    assert sync_labels.sync_labels("podaac/source", "podaac") == 0
+
+
+def test_milestone_failures_set_the_exit_code(monkeypatch):
+    monkeypatch.setattr(sync_milestones, "list_repositories", lambda org, archived: REPOS)
+    monkeypatch.setattr(sync_milestones, "rest_list", lambda path: [{"title": "v1", "state": "open"}]
+                        if path.startswith("/repos/podaac/source/") else [])
+    monkeypatch.setattr(sync_milestones, "rest", fail_on("podaac/a"))
+    assert sync_milestones.sync_milestones("podaac/source", "podaac") == 1